@@ -1,11 +1,9 @@
 # Configuration file for the Sphinx documentation builder.
 
-import sys
 from pathlib import Path
 
-# Add project root to path
+# Project root, used to locate the package sources
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
 
 project = 'phytrace'
 copyright = '2025, phytrace contributors'
@@ -13,7 +11,7 @@ author = 'phytrace contributors'
 release = '0.1.0'
 
 extensions = [
-    'sphinx.ext.autodoc',
+    'autoapi.extension',  # Parses sources statically; phytrace is never imported
     'sphinx.ext.napoleon',
     'sphinx.ext.viewcode',
     'sphinx.ext.intersphinx',
@@ -21,11 +19,23 @@ extensions = [
 ]
 
 templates_path = ['_templates']
-exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
+exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store', '**.ipynb_checkpoints']
 
 html_theme = 'sphinx_rtd_theme'  # Read the Docs theme
 html_static_path = ['_static']
 
+# AutoAPI settings: the API pages under api/ are written by hand with
+# autoapimodule directives, so no extra pages are generated or rewritten
+autoapi_type = 'python'
+autoapi_dirs = [str(project_root / 'phytrace')]
+autoapi_generate_api_docs = False
+autoapi_add_toctree_entry = False
+autoapi_options = ['members', 'undoc-members', 'show-inheritance']
+
+# Notebooks are rendered from their stored outputs and never re-executed,
+# which keeps incremental builds fast
+nbsphinx_execute = 'never'
+
 # Napoleon settings for Google-style docstrings
 napoleon_google_docstring = True
 napoleon_numpy_docstring = False
@@ -38,3 +48,11 @@ intersphinx_mapping = {
     'scipy': ('https://docs.scipy.org/doc/scipy/', None),
 }
 
+
+def _skip_imported_members(app, what, name, obj, skip, options):
+    """Document names imported from other modules only on their own page."""
+    return skip or getattr(obj, 'imported', False)
+
+
+def setup(app):
+    app.connect('autodoc-skip-member', _skip_imported_members)
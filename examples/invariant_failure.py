@@ -30,10 +30,15 @@ print("=" * 60)
 print("Example 1: Warning-level invariant violation")
 print("=" * 60)
 
+# Invariants receive the state as an ndarray (plus previous_state/previous_time
+# keyword arguments after the first check). The one-element state of this
+# system is compared as a scalar, which avoids building temporary arrays.
 @create_invariant(name="bounded_warning", severity="warning")
-def bounded_warning(t, y, params):
+def bounded_warning(t, y, params, **kwargs):
     """Warning-level bounded check."""
-    return np.all((np.asarray(y) >= -5.0) & (np.asarray(y) <= 5.0))
+    if y.shape[0] == 1:
+        return -5.0 <= y[0] <= 5.0
+    return bool(np.all((y >= -5.0) & (y <= 5.0)))
 
 bound_check_warning = bounded_warning
 
@@ -61,9 +66,11 @@ print("Example 2: Error-level invariant violation")
 print("=" * 60)
 
 @create_invariant(name="bounded_error", severity="error")
-def bounded_error(t, y, params):
+def bounded_error(t, y, params, **kwargs):
     """Error-level bounded check."""
-    return np.all((np.asarray(y) >= -2.0) & (np.asarray(y) <= 2.0))
+    if y.shape[0] == 1:
+        return -2.0 <= y[0] <= 2.0
+    return bool(np.all((y >= -2.0) & (y <= 2.0)))
 
 bound_check_error = bounded_error
 
@@ -91,9 +98,11 @@ print("Example 3: Critical invariant violation (simulation stops)")
 print("=" * 60)
 
 @create_invariant(name="never_exceeds_10", severity="critical")
-def never_exceeds_10(t, y, params):
+def never_exceeds_10(t, y, params, **kwargs):
     """Critical invariant: value must never exceed 10."""
-    return np.all(np.asarray(y) <= 10.0)
+    if y.shape[0] == 1:
+        return y[0] <= 10.0
+    return bool(np.all(y <= 10.0))
 
 try:
     result3 = trace_run(
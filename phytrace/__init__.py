@@ -7,27 +7,77 @@ A minimal wrapper around scipy.integrate.solve_ivp that adds:
 - Runtime invariant checking
 - Structured evidence packs for reproducibility
 - Deterministic execution by default
+
+The initial state passed to trace_run is normalized to a contiguous float64
+array, so simulate functions and invariants receive float64 ndarray states.
 """
 
 __version__ = "0.1.2.post1"
 
-# Core functionality
-from .core import trace_run
-from .invariants import (
-    InvariantCheck,
-    InvariantChecker,
-    create_invariant,
-    bounded,
-    monotonic,
-    finite,
-)
-from .types import TraceResult, ParamsDict, StateVector
-
-# Golden test framework (v0.1.0 - basic functionality)
-from .golden import GoldenTest, golden_test, store_golden, compare_results
-
-# Reproducibility contract (v0.1.2)
-from .reproducibility import get_reproducibility_contract, ReproducibilityContract
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Public names and the submodule defining each. They are imported on first
+# attribute access (PEP 562), so `import phytrace` does not pull in numpy,
+# scipy or matplotlib until something that needs them is used.
+_LAZY_ATTRIBUTES = {
+    # Core functionality
+    "trace_run": "core",
+    "InvariantCheck": "invariants",
+    "InvariantChecker": "invariants",
+    "create_invariant": "invariants",
+    "bounded": "invariants",
+    "monotonic": "invariants",
+    "finite": "invariants",
+    "TraceResult": "types",
+    "ParamsDict": "types",
+    "StateVector": "types",
+    # Golden test framework (v0.1.0 - basic functionality)
+    "GoldenTest": "golden",
+    "golden_test": "golden",
+    "store_golden": "golden",
+    "compare_results": "golden",
+    # Reproducibility contract (v0.1.2)
+    "get_reproducibility_contract": "reproducibility",
+    "ReproducibilityContract": "reproducibility",
+}
+
+if TYPE_CHECKING:
+    from .core import trace_run
+    from .invariants import (
+        InvariantCheck,
+        InvariantChecker,
+        create_invariant,
+        bounded,
+        monotonic,
+        finite,
+    )
+    from .types import TraceResult, ParamsDict, StateVector
+    from .golden import GoldenTest, golden_test, store_golden, compare_results
+    from .reproducibility import get_reproducibility_contract, ReproducibilityContract
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names, or submodules, on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        if not name.startswith('__'):
+            # Submodules such as phytrace.invariants stay reachable as
+            # attributes after a bare `import phytrace`
+            try:
+                return importlib.import_module(f".{name}", __name__)
+            except ModuleNotFoundError as e:
+                if e.name != f"{__name__}.{name}":
+                    raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     "trace_run",
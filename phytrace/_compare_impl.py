@@ -0,0 +1,67 @@
+"""
+Trajectory comparison for the ``phytrace compare`` command.
+
+Kept out of ``phytrace.cli`` so that numpy is only imported when both
+evidence packs actually contain trajectory data.
+"""
+
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+def _read_trajectory_csv(path: Path) -> Tuple[List[str], np.ndarray]:
+    """Read an evidence pack trajectory.csv.
+    
+    Returns:
+        Tuple of (column names, 2D array with one row per time point)
+    """
+    with open(path) as f:
+        columns = f.readline().strip().split(',')
+    data = np.loadtxt(path, delimiter=',', skiprows=1, ndmin=2)
+    return columns, data
+
+
+def _compare_trajectories(path1: Path, path2: Path) -> Optional[Tuple[float, float]]:
+    """Compare the first state variable of two trajectory.csv files.
+    
+    Both trajectories are linearly interpolated onto 100 common time
+    points spanning the overlap of their time ranges.
+    
+    Args:
+        path1: Path to the first trajectory.csv
+        path2: Path to the second trajectory.csv
+    
+    Returns:
+        Tuple of (max difference, RMS difference), or None if either file
+        lacks a time column or state columns
+    """
+    columns1, data1 = _read_trajectory_csv(path1)
+    columns2, data2 = _read_trajectory_csv(path2)
+    
+    if 'time' not in columns1 or 'time' not in columns2:
+        return None
+    
+    state_cols1 = [i for i, c in enumerate(columns1) if c.startswith('state_')]
+    state_cols2 = [i for i, c in enumerate(columns2) if c.startswith('state_')]
+    if not state_cols1 or not state_cols2:
+        return None
+    
+    # np.interp needs increasing times; backward integrations store them
+    # decreasing, so order both trajectories by time first
+    order1 = np.argsort(data1[:, columns1.index('time')], kind='stable')
+    order2 = np.argsort(data2[:, columns2.index('time')], kind='stable')
+    t1 = data1[order1, columns1.index('time')]
+    t2 = data2[order2, columns2.index('time')]
+    
+    # Interpolate to common times
+    t_common = np.linspace(max(t1[0], t2[0]), min(t1[-1], t2[-1]), 100)
+    
+    y1 = np.interp(t_common, t1, data1[order1, state_cols1[0]])
+    y2 = np.interp(t_common, t2, data2[order2, state_cols2[0]])
+    
+    diff = y1 - y2
+    max_diff = float(np.abs(diff).max())
+    rms_diff = float(np.sqrt(np.dot(diff, diff) / diff.size))
+    return max_diff, rms_diff
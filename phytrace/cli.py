@@ -6,54 +6,36 @@ and managing golden tests.
 """
 
 import json
+import os
 from pathlib import Path
-from typing import Optional
 
 try:
     import click
     CLICK_AVAILABLE = True
 except ImportError:
     CLICK_AVAILABLE = False
-    # Fallback if click not available (should not happen if installed correctly)
-    class ClickFallback:
-        @staticmethod
-        def group(*args, **kwargs):
-            def decorator(f):
-                return f
-            return decorator
-        
-        @staticmethod
-        def command(*args, **kwargs):
-            def decorator(f):
-                return f
-            return decorator
-        
-        @staticmethod
-        def argument(*args, **kwargs):
-            def decorator(f):
-                return f
-            return decorator
-        
-        @staticmethod
-        def option(*args, **kwargs):
-            def decorator(f):
-                return f
-            return decorator
-        
-        @staticmethod
-        def echo(*args, **kwargs):
-            print(*args, **kwargs)
-        
-        @staticmethod
-        def Path(*args, **kwargs):
-            from pathlib import Path as P
-            return P
-        
-        @staticmethod
-        def Choice(*args, **kwargs):
-            return lambda x: x
+    # Fallback if click not available (should not happen if installed correctly).
+    # The decorators return functions unchanged so the module still imports
+    # and main() can report the missing dependency.
+    def _identity(f):
+        return f
     
-    click = ClickFallback()
+    def _noop_dec(*args, **kwargs):
+        return _identity
+    
+    def _group(*args, **kwargs):
+        def decorator(f):
+            f.command = _noop_dec  # Used as @cli.command() below
+            return f
+        return decorator
+    
+    class _Click:
+        group = staticmethod(_group)
+        command = argument = option = staticmethod(_noop_dec)
+        echo = staticmethod(print)
+        Path = Choice = staticmethod(lambda *args, **kwargs: str)
+    
+    click = _Click
 
 try:
     from rich.console import Console
@@ -64,9 +46,43 @@ except ImportError:
     RICH_AVAILABLE = False
     rprint = print
 
-from .evidence import create_evidence_pack
-from .golden import store_golden, load_golden, compare_results
-from .types import TraceResult
+# orjson is optional: it parses and serializes JSON faster than the
+# standard library. orjson.JSONDecodeError subclasses json.JSONDecodeError,
+# so error handling is the same either way.
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Marks a key absent from a manifest dict
+_MISSING = object()
+
+# Evidence pack layout checked by validate, in reporting order
+_REQUIRED_FILES = ('manifest.json', 'run_log.txt', 'invariants.json', 'report.md')
+_REQUIRED_DIRS = ('data', 'plots', 'checks')
+_JSON_FILES = ('manifest.json', 'invariants.json')
+
+# Manifest sections checked by validate, in reporting order:
+# (section, severity if missing, message if missing, sub-keys that only
+# raise a warning when absent)
+_MANIFEST_CHECKS = (
+    ('environment', 'issue', "Missing environment information in manifest", (
+        ('python', "Python version not captured in environment"),
+        ('packages', "Package versions not captured in environment"),
+    )),
+    ('seeds', 'issue', "Missing seed information in manifest", ()),
+    ('reproducibility_contract', 'warning',
+     "Reproducibility contract not present in manifest (v0.1.2+)", ()),
+    ('simulation', 'issue', "Missing simulation information in manifest", (
+        ('params', "No parameters recorded in simulation"),
+        ('solver', "No solver configuration recorded"),
+    )),
+    ('invariants', 'warning', "No invariant definitions in manifest", ()),
+)
+
 from .reproducibility import get_reproducibility_contract
 
 
@@ -76,26 +92,8 @@ else:
     console = None
 
 
-@click.group()
-def cli():
-    """phytrace: Provenance tracking for scientific simulations."""
-    pass
-
-
-@cli.command()
-@click.argument('directory', type=click.Path())
-def init(directory: str):
-    """Initialize a new phytrace project.
-    
-    Creates example project structure with template simulation file
-    and configuration.
-    """
-    dir_path = Path(directory)
-    dir_path.mkdir(parents=True, exist_ok=True)
-    
-    # Create example simulation file
-    sim_file = dir_path / "simulation.py"
-    sim_file.write_text('''"""
+# Templates written by init
+_SIM_TEMPLATE = b'''"""
 Example simulation using phytrace.
 """
 
@@ -119,11 +117,9 @@ if __name__ == "__main__":
     
     print(f"Success: {result.success}")
     print(f"Function evaluations: {result.nfev}")
-''')
-    
-    # Create configuration file
-    config_file = dir_path / "phytrace.toml"
-    config_file.write_text('''[evidence]
+'''
+
+_CONFIG_TEMPLATE = b'''[evidence]
 default_dir = "./evidence"
 auto_plots = true
 plot_format = "png"
@@ -141,12 +137,9 @@ fail_on_critical = true
 
 [seeds]
 default_seed = 42
-''')
-    
-    # Create .gitignore
-    gitignore = dir_path / ".gitignore"
-    if not gitignore.exists():
-        gitignore.write_text('''# Evidence packs
+'''
+
+_GITIGNORE_TEMPLATE = b'''# Evidence packs
 evidence/
 .golden/
 
@@ -154,7 +147,49 @@ evidence/
 __pycache__/
 *.pyc
 *.pyo
-''')
+'''
+
+
+def _write_bytes(path: Path, data: bytes):
+    """Write data to path with raw os calls, replacing any existing file."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:  # os.write may write fewer bytes than requested
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@click.group()
+def cli():
+    """phytrace: Provenance tracking for scientific simulations."""
+    pass
+
+
+@cli.command()
+@click.argument('directory', type=click.Path())
+def init(directory: str):
+    """Initialize a new phytrace project.
+    
+    Creates example project structure with template simulation file
+    and configuration.
+    """
+    dir_path = Path(directory)
+    dir_path.mkdir(parents=True, exist_ok=True)
+    
+    # Create example simulation file
+    sim_file = dir_path / "simulation.py"
+    _write_bytes(sim_file, _SIM_TEMPLATE)
+    
+    # Create configuration file
+    config_file = dir_path / "phytrace.toml"
+    _write_bytes(config_file, _CONFIG_TEMPLATE)
+    
+    # Create .gitignore
+    gitignore = dir_path / ".gitignore"
+    if not gitignore.exists():
+        _write_bytes(gitignore, _GITIGNORE_TEMPLATE)
     
     click.echo(f"✓ Initialized project in {directory}")
     click.echo(f"  Created: {sim_file.name}")
@@ -162,7 +197,7 @@ __pycache__/
 
 
 @cli.command()
-@click.argument('evidence_dir', type=click.Path(exists=True))
+@click.argument('evidence_dir', type=click.Path(exists=True, file_okay=False))
 @click.option('--json', 'output_json', is_flag=True, help='Output validation results as JSON')
 def validate(evidence_dir: str, output_json: bool):
     """Validate an evidence pack.
@@ -180,100 +215,73 @@ def validate(evidence_dir: str, output_json: bool):
     warnings = []
     checks = {}
     
+    # One directory listing answers every existence check below
+    with os.scandir(evidence_path) as it:
+        entries = {entry.name: entry for entry in it}
+    
+    def is_file(name):
+        return name in entries and entries[name].is_file()
+    
+    def is_dir(name):
+        return name in entries and entries[name].is_dir()
+    
     # Check required files
-    required_files = [
-        'manifest.json',
-        'run_log.txt',
-        'invariants.json',
-        'report.md'
-    ]
-    
-    for file in required_files:
-        file_path = evidence_path / file
-        if not file_path.exists():
+    for file in _REQUIRED_FILES:
+        present = is_file(file)
+        if not present:
             issues.append(f"Missing required file: {file}")
-        checks[f"file_{file}"] = file_path.exists()
+        checks[f"file_{file}"] = present
     
     # Check directories
-    required_dirs = ['data', 'plots', 'checks']
-    for dir_name in required_dirs:
-        dir_path = evidence_path / dir_name
-        if not dir_path.exists():
+    for dir_name in _REQUIRED_DIRS:
+        present = is_dir(dir_name)
+        if not present:
             issues.append(f"Missing required directory: {dir_name}")
-        checks[f"dir_{dir_name}"] = dir_path.exists()
+        checks[f"dir_{dir_name}"] = present
     
-    # Validate JSON files
-    json_files = ['manifest.json', 'invariants.json']
-    for json_file in json_files:
-        json_path = evidence_path / json_file
-        if json_path.exists():
+    # Validate JSON files, parsing each once for the checks below
+    parsed = {}
+    parse_errors = {}
+    for json_file in _JSON_FILES:
+        if is_file(json_file):
             try:
-                with open(json_path) as f:
-                    data = json.load(f)
-                    checks[f"json_valid_{json_file}"] = True
-            except json.JSONDecodeError as e:
+                # ValueError also covers bytes that are not valid UTF-8
+                parsed[json_file] = _loads((evidence_path / json_file).read_bytes())
+                checks[f"json_valid_{json_file}"] = True
+            except ValueError as e:
                 issues.append(f"Invalid JSON in {json_file}: {e}")
                 checks[f"json_valid_{json_file}"] = False
+                parse_errors[json_file] = e
     
     # Check manifest completeness
-    manifest_path = evidence_path / 'manifest.json'
-    manifest = None
-    if manifest_path.exists():
+    manifest = parsed.get('manifest.json')
+    if 'manifest.json' in parse_errors:
+        issues.append(f"Error reading manifest: {parse_errors['manifest.json']}")
+        checks["manifest_readable"] = False
+    elif 'manifest.json' in parsed:
         try:
-            with open(manifest_path) as f:
-                manifest = json.load(f)
-            
-            # Check environment capture
-            if 'environment' not in manifest:
-                issues.append("Missing environment information in manifest")
-            else:
-                env = manifest.get('environment', {})
-                checks["has_environment"] = True
-                if 'python' not in env:
-                    warnings.append("Python version not captured in environment")
-                if 'packages' not in env:
-                    warnings.append("Package versions not captured in environment")
-            
-            # Check seed information
-            if 'seeds' not in manifest:
-                issues.append("Missing seed information in manifest")
-            else:
-                seeds = manifest.get('seeds', {})
-                checks["has_seeds"] = True
-                if not any(seeds.values()):
+            for key, severity, message, subkeys in _MANIFEST_CHECKS:
+                section = manifest.get(key, _MISSING)
+                if section is _MISSING:
+                    (issues if severity == 'issue' else warnings).append(message)
+                    continue
+                checks[f"has_{key}"] = True
+                for subkey, sub_message in subkeys:
+                    if subkey not in section:
+                        warnings.append(sub_message)
+                if key == 'seeds' and not any(section.values()):
                     warnings.append("No seeds were successfully set")
-            
-            # Check reproducibility contract
-            if 'reproducibility_contract' not in manifest:
-                warnings.append("Reproducibility contract not present in manifest (v0.1.2+)")
-            else:
-                checks["has_reproducibility_contract"] = True
-            
-            # Check simulation parameters
-            if 'simulation' not in manifest:
-                issues.append("Missing simulation information in manifest")
-            else:
-                sim = manifest.get('simulation', {})
-                checks["has_simulation"] = True
-                if 'params' not in sim:
-                    warnings.append("No parameters recorded in simulation")
-                if 'solver' not in sim:
-                    warnings.append("No solver configuration recorded")
-            
-            # Check invariant logs
-            if 'invariants' not in manifest:
-                warnings.append("No invariant definitions in manifest")
-            else:
-                checks["has_invariants"] = True
-            
+        
         except Exception as e:
             issues.append(f"Error reading manifest: {e}")
             checks["manifest_readable"] = False
     
     # Check data files
-    data_dir = evidence_path / 'data'
-    if data_dir.exists():
-        csv_exists = (data_dir / 'trajectory.csv').exists()
+    if is_dir('data'):
+        with os.scandir(evidence_path / 'data') as it:
+            csv_exists = any(
+                entry.name == 'trajectory.csv' and entry.is_file() for entry in it
+            )
         checks["has_trajectory_csv"] = csv_exists
         if not csv_exists:
             issues.append("Missing trajectory.csv in data/")
@@ -281,17 +289,13 @@ def validate(evidence_dir: str, output_json: bool):
         checks["has_trajectory_csv"] = False
     
     # Check invariants.json
-    invariants_path = evidence_path / 'invariants.json'
-    if invariants_path.exists():
-        try:
-            with open(invariants_path) as f:
-                inv_data = json.load(f)
-                checks["invariants_json_valid"] = True
-                if not inv_data:
-                    warnings.append("invariants.json is empty")
-        except Exception as e:
-            issues.append(f"Error reading invariants.json: {e}")
-            checks["invariants_json_valid"] = False
+    if 'invariants.json' in parse_errors:
+        issues.append(f"Error reading invariants.json: {parse_errors['invariants.json']}")
+        checks["invariants_json_valid"] = False
+    elif 'invariants.json' in parsed:
+        checks["invariants_json_valid"] = True
+        if not parsed['invariants.json']:
+            warnings.append("invariants.json is empty")
     else:
         checks["invariants_json_valid"] = False
     
@@ -311,7 +315,11 @@ def validate(evidence_dir: str, output_json: bool):
     
     # Output results
     if output_json:
-        click.echo(json.dumps(validation_result, indent=2))
+        if ORJSON_AVAILABLE:
+            # Decoded so text-only streams (e.g. redirected stdout) work too
+            click.echo(orjson.dumps(validation_result, option=orjson.OPT_INDENT_2).decode())
+        else:
+            click.echo(json.dumps(validation_result, indent=2))
     else:
         if issues:
             click.echo("✗ Validation failed. Issues found:")
@@ -370,14 +378,12 @@ def compare(dir1: str, dir2: str, tolerance: float):
     manifest1_path = path1 / 'manifest.json'
     manifest2_path = path2 / 'manifest.json'
     
-    if not manifest1_path.exists() or not manifest2_path.exists():
+    if not manifest1_path.is_file() or not manifest2_path.is_file():
         click.echo("Error: Both directories must contain manifest.json")
         return
     
-    with open(manifest1_path) as f:
-        manifest1 = json.load(f)
-    with open(manifest2_path) as f:
-        manifest2 = json.load(f)
+    manifest1 = _loads(manifest1_path.read_bytes())
+    manifest2 = _loads(manifest2_path.read_bytes())
     
     # Compare parameters
     sim1 = manifest1.get('simulation', {})
@@ -386,14 +392,19 @@ def compare(dir1: str, dir2: str, tolerance: float):
     params2 = sim2.get('params', {})
     
     click.echo("Parameter Comparison:")
-    all_params = set(params1.keys()) | set(params2.keys())
     param_diffs = []
-    for param in all_params:
-        val1 = params1.get(param, 'N/A')
-        val2 = params2.get(param, 'N/A')
-        if val1 != val2:
+    for param, val1 in params1.items():
+        val2 = params2.get(param, _MISSING)
+        if val2 is _MISSING:
+            param_diffs.append((param, val1, 'N/A'))
+        elif val1 != val2:
             param_diffs.append((param, val1, val2))
-            click.echo(f"  {param}: {val1} → {val2}")
+    for param, val2 in params2.items():
+        if param not in params1:
+            param_diffs.append((param, 'N/A', val2))
+    
+    for param, val1, val2 in param_diffs:
+        click.echo(f"  {param}: {val1} → {val2}")
     
     if not param_diffs:
         click.echo("  (No parameter differences)")
@@ -402,44 +413,23 @@ def compare(dir1: str, dir2: str, tolerance: float):
     data1_path = path1 / 'data' / 'trajectory.csv'
     data2_path = path2 / 'data' / 'trajectory.csv'
     
-    if data1_path.exists() and data2_path.exists():
+    if data1_path.is_file() and data2_path.is_file():
         try:
-            import pandas as pd
-            df1 = pd.read_csv(data1_path)
-            df2 = pd.read_csv(data2_path)
+            from ._compare_impl import _compare_trajectories
             
-            # Simple comparison (time series)
-            if 'time' in df1.columns and 'time' in df2.columns:
-                # Interpolate to common times
-                from scipy.interpolate import interp1d
-                import numpy as np
-                
-                t1 = df1['time'].values
-                t2 = df2['time'].values
-                t_common = np.linspace(max(t1[0], t2[0]), min(t1[-1], t2[-1]), 100)
+            stats = _compare_trajectories(data1_path, data2_path)
+            if stats is not None:
+                max_diff, rms_diff = stats
                 
-                state_cols1 = [c for c in df1.columns if c.startswith('state_')]
-                state_cols2 = [c for c in df2.columns if c.startswith('state_')]
+                click.echo(f"\nTrajectory Comparison:")
+                click.echo(f"  Max difference: {max_diff:.2e}")
+                click.echo(f"  RMS difference: {rms_diff:.2e}")
+                click.echo(f"  Tolerance: {tolerance:.2e}")
                 
-                if state_cols1 and state_cols2:
-                    # Compare first state variable
-                    y1 = interp1d(t1, df1[state_cols1[0]].values)(t_common)
-                    y2 = interp1d(t2, df2[state_cols2[0]].values)(t_common)
-                    
-                    max_diff = np.max(np.abs(y1 - y2))
-                    rms_diff = np.sqrt(np.mean((y1 - y2)**2))
-                    
-                    click.echo(f"\nTrajectory Comparison:")
-                    click.echo(f"  Max difference: {max_diff:.2e}")
-                    click.echo(f"  RMS difference: {rms_diff:.2e}")
-                    click.echo(f"  Tolerance: {tolerance:.2e}")
-                    
-                    if max_diff > tolerance:
-                        click.echo(f"  ✗ Trajectories differ beyond tolerance")
-                    else:
-                        click.echo(f"  ✓ Trajectories match within tolerance")
-        except ImportError:
-            click.echo("\nNote: Install pandas for trajectory comparison")
+                if max_diff > tolerance:
+                    click.echo(f"  ✗ Trajectories differ beyond tolerance")
+                else:
+                    click.echo(f"  ✓ Trajectories match within tolerance")
         except Exception as e:
             click.echo(f"\nError comparing trajectories: {e}")
 
@@ -44,10 +44,12 @@ def trace_run(
     - Evidence pack generation
     
     Args:
-        simulate: ODE right-hand side function: f(t, y, **params) -> dy/dt
+        simulate: ODE right-hand side function: f(t, y, **params) -> dy/dt.
+            May be a compiled callable such as a numba dispatcher
         params: Dictionary of simulation parameters
         t_span: Time span (t0, tf) for integration
-        y0: Initial state vector
+        y0: Initial state vector, converted once to a contiguous float64
+            array (complex128 for complex input)
         invariants: Optional list of InvariantCheck objects to verify
         method: ODE solver method (default: 'RK45')
         evidence_dir: Optional directory path for evidence pack
@@ -55,7 +57,9 @@ def trace_run(
         dense_output: Whether to compute dense output solution
         events: Optional event function for solve_ivp
         progress_callback: Optional callback(t, y) called during integration
-        **solver_kwargs: Additional arguments passed to solve_ivp
+        **solver_kwargs: Additional arguments passed to solve_ivp. If `args`
+            is given, it is passed to simulate positionally in place of params
+            and recorded in the manifest's solver section
     
     Returns:
         TraceResult object extending OdeResult with provenance metadata
@@ -79,6 +83,12 @@ def trace_run(
         ...     evidence_dir='./evidence/run_001'
         ... )
     """
+    # Normalize the initial state once, so solve_ivp, simulate and the
+    # invariants all work with the same contiguous float64 (or complex) array
+    y0 = np.ascontiguousarray(
+        y0, dtype=np.complex128 if np.iscomplexobj(y0) else np.float64
+    )
+    
     # Step 1: Set seeds for reproducibility
     seeds_set = set_global_seeds(seed)
     
@@ -91,43 +101,59 @@ def trace_run(
         evidence_path = Path(evidence_dir)
         evidence_path.mkdir(parents=True, exist_ok=True)
     
-    # Step 4: Set up invariant checker
+    # Step 4: Set up invariant checkers
+    # Critical invariants are checked on every RHS evaluation so a violation
+    # can stop the run. Warning and error invariants only need to be logged.
+    # Without t_eval the solver returns every accepted step, so they are
+    # checked once over the solved trajectory instead. With t_eval the
+    # trajectory holds only the requested samples, so they stay in the
+    # per-step path, where a breach between samples is still seen.
+    invariants_list = invariants or []
+    severities = {inv.name: inv.severity for inv in invariants_list}
+    all_checker = InvariantChecker(invariants_list)
     invariant_checker = None
+    trajectory_checker = None
     if invariants:
-        invariant_checker = InvariantChecker(invariants)
+        # Invariant objects may be shared between runs; count this run only
+        all_checker.reset()
+        defer = solver_kwargs.get('t_eval') is None
+        per_step = [inv for inv in invariants
+                    if inv.severity == 'critical' or not defer]
+        deferred = [inv for inv in invariants
+                    if inv.severity != 'critical' and defer]
+        if per_step:
+            invariant_checker = InvariantChecker(per_step)
+        if deferred:
+            trajectory_checker = InvariantChecker(deferred)
     
     # Step 5: Wrap simulate function to check invariants
     violation_log: List[Dict[str, Any]] = []
-    invariants_list = invariants or []  # Store for use in closure
     
-    def wrapped_simulate(t: float, y: StateVector) -> StateVector:
+    # Resolve how simulate takes its parameters once, not on every RHS call
+    sig = inspect.signature(simulate)
+    pass_params = 'params' in sig.parameters or len(sig.parameters) > 2
+    
+    def wrapped_simulate(t: float, y: StateVector, *args) -> StateVector:
         """Wrapper that checks invariants before calling simulate."""
-        # Check invariants
+        # Check per-step invariants
         if invariant_checker:
             violations = invariant_checker.check(t, y, params)
             
             for inv_name in violations:
-                # Find the invariant to get its severity
-                inv = next((inv for inv in invariants_list if inv.name == inv_name), None)
-                if inv:
-                    violation_info = {
-                        'time': t,
-                        'state': np.asarray(y).tolist(),
-                        'invariant': inv_name,
-                        'severity': inv.severity
-                    }
-                    violation_log.append(violation_info)
-                    
-                    # Handle based on severity
-                    if inv.severity == 'critical':
-                        raise RuntimeError(
-                            f"Critical invariant '{inv_name}' violated at t={t:.6f}. "
-                            f"State: {y}. Simulation stopped."
-                        )
-                    elif inv.severity == 'error':
-                        # Log but continue
-                        pass
-                    # 'warning' severity just logs
+                severity = severities[inv_name]
+                violation_log.append({
+                    'time': t,
+                    'state': np.asarray(y).tolist(),
+                    'invariant': inv_name,
+                    'severity': severity
+                })
+                
+                # Handle based on severity; 'error' and 'warning' just log
+                if severity == 'critical':
+                    raise RuntimeError(
+                        f"Critical invariant '{inv_name}' violated at t={t:.6f}. "
+                        f"State: {y}. Simulation stopped."
+                    )
         
         # Call progress callback if provided
         if progress_callback:
@@ -137,9 +163,14 @@ def trace_run(
                 pass  # Don't let callback errors stop simulation
         
         # Call original simulate function
+        # The return value is handed to solve_ivp without copying, and the
+        # solvers keep it between steps (e.g. as f for a retried step), so
+        # it must be a fresh array rather than a buffer reused across calls.
         # Handle different function signatures
-        sig = inspect.signature(simulate)
-        if 'params' in sig.parameters or len(sig.parameters) > 2:
+        if args:
+            # Extra positional arguments forwarded by solve_ivp's `args`
+            return simulate(t, y, *args)
+        elif pass_params:
             # Function expects params as separate arguments
             return simulate(t, y, **params)
         else:
@@ -164,11 +195,23 @@ def trace_run(
         # Otherwise, let it propagate
         raise
     
-    # Step 7: Collect invariant summary
+    # Step 7: Check remaining invariants over the trajectory and summarize
+    if trajectory_checker:
+        violations = trajectory_checker.check_trajectory(
+            ode_result.t, ode_result.y, params
+        )
+        for i, inv_name in violations:
+            violation_log.append({
+                'time': float(ode_result.t[i]),
+                'state': ode_result.y[:, i].tolist(),
+                'invariant': inv_name,
+                'severity': severities[inv_name]
+            })
+    
     invariant_summary = {}
     checks_passed = True
-    if invariant_checker:
-        invariant_summary = invariant_checker.get_summary()
+    if invariants:
+        invariant_summary = all_checker.get_summary()
         # Check if any critical or error invariants failed
         for inv in invariants_list:
             if inv.severity in ('critical', 'error') and inv.violations > 0:
@@ -254,19 +297,27 @@ def _create_manifest(
     func_name = simulate.__name__
     func_module = getattr(simulate, '__module__', 'unknown')
     try:
-        func_file = inspect.getfile(simulate)
+        # Compiled callables (e.g. numba dispatchers) keep the Python
+        # function they were built from on `py_func`
+        func_file = inspect.getfile(getattr(simulate, 'py_func', simulate))
     except (TypeError, OSError):
         func_file = 'unknown'
     
     # Convert params to serializable format
-    serializable_params = {}
-    for key, value in params.items():
-        if isinstance(value, (int, float, str, bool)):
-            serializable_params[key] = value
-        elif isinstance(value, np.ndarray):
-            serializable_params[key] = value.tolist()
-        else:
-            serializable_params[key] = str(value)
+    serializable_params = {
+        key: _to_serializable(value) for key, value in params.items()
+    }
+    
+    solver_config = {
+        'method': method,
+        **{k: v for k, v in solver_kwargs.items() 
+           if isinstance(v, (int, float, str, bool))}
+    }
+    if solver_kwargs.get('args') is not None:
+        # simulate ran on these positional values rather than on params
+        solver_config['args'] = [
+            _to_serializable(value) for value in solver_kwargs['args']
+        ]
     
     manifest = {
         'run_id': str(uuid.uuid4()),
@@ -279,11 +330,7 @@ def _create_manifest(
             'params': serializable_params,
             'initial_state': np.asarray(y0).tolist(),
             't_span': list(t_span),
-            'solver': {
-                'method': method,
-                **{k: v for k, v in solver_kwargs.items() 
-                   if isinstance(v, (int, float, str, bool))}
-            }
+            'solver': solver_config
         },
         'invariants': [
             {
@@ -306,3 +353,13 @@ def _create_manifest(
     
     return manifest
 
+
+def _to_serializable(value: Any) -> Any:
+    """Convert a parameter value to a JSON-serializable form."""
+    if isinstance(value, (int, float, str, bool)):
+        return value
+    elif isinstance(value, np.ndarray):
+        return value.tolist()
+    else:
+        return str(value)
+
@@ -11,12 +11,69 @@ IMPORTANT: Invariants are runtime diagnostics, not formal proofs.
 - Invariants help catch errors early but are not a substitute for validation
 """
 
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 
-from .types import InvariantCheck, InvariantFunc, ParamsDict, StateVector
+from .types import (
+    BatchInvariantFunc,
+    InvariantCheck,
+    InvariantFunc,
+    ParamsDict,
+    StateVector,
+)
+
+
+# Per-step kernels for the built-in invariants. Each loop folds every
+# comparison into one flag without branching, so numba can vectorize it.
+# NaN fails both comparisons in _within_loop, and v - v is NaN for inf and
+# NaN, so no separate NaN check is needed.
+
+def _within_loop(values, min_val, max_val):
+    ok = True
+    for i in range(values.shape[0]):
+        v = values[i]
+        ok &= (v >= min_val) & (v <= max_val)
+    return ok
+
+
+def _finite_loop(values):
+    ok = True
+    for i in range(values.shape[0]):
+        v = values[i]
+        ok &= (v - v) == 0.0
+    return ok
+
+
+@lru_cache(maxsize=None)
+def _compiled_kernels() -> Optional[Tuple[Callable, Callable]]:
+    """Compile the per-step kernels with numba, if it is installed.
+    
+    numba is imported on first use rather than at module import, so that
+    importing phytrace stays cheap.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_within_loop), njit(cache=True)(_finite_loop)
+
+
+def _all_within(values: np.ndarray, min_val: float, max_val: float) -> bool:
+    """Check that every value lies in [min_val, max_val]."""
+    kernels = _compiled_kernels()
+    if kernels is not None and values.dtype == np.float64:
+        return kernels[0](values.ravel(), min_val, max_val)
+    return bool(np.all((values >= min_val) & (values <= max_val)))
+
+
+def _all_finite(values: np.ndarray) -> bool:
+    """Check that no value is NaN or inf."""
+    kernels = _compiled_kernels()
+    if kernels is not None and values.dtype == np.float64:
+        return kernels[1](values.ravel())
+    return bool(np.all(np.isfinite(values)))
 
 
 class InvariantChecker:
@@ -87,6 +144,71 @@ class InvariantChecker:
         
         return violations
     
+    def check_trajectory(self, t: np.ndarray, y: np.ndarray,
+                         params: ParamsDict) -> List[Tuple[int, str]]:
+        """Check all invariants at every point of a solved trajectory.
+        
+        Invariants with a batch_func are evaluated over the whole trajectory
+        in one call. Others are called once per point, in time order, with
+        the same previous_state/previous_time context as check().
+        
+        Args:
+            t: Time points, shape (n_points,); may be empty
+            y: States, shape (n_states, n_points) or (n_points,)
+            params: Simulation parameters
+        
+        Returns:
+            List of (point index, invariant name) pairs for each violation,
+            ordered by point index
+        """
+        t = np.asarray(t)
+        n_points = len(t)
+        violations: List[Tuple[int, str]] = []
+        if n_points == 0:
+            # E.g. the solver failed before reaching the first t_eval point
+            return violations
+        
+        y = np.asarray(y)
+        if y.ndim == 1:
+            y = y.reshape(1, n_points)
+        
+        for inv in self.invariants:
+            inv.total_checks += n_points
+            
+            if inv.batch_func is not None:
+                try:
+                    ok = np.asarray(inv.batch_func(t, y, params), dtype=bool)
+                    if ok.shape != (n_points,):
+                        raise ValueError(
+                            f"batch_func of '{inv.name}' returned shape "
+                            f"{ok.shape}, expected ({n_points},)"
+                        )
+                    failed = np.flatnonzero(~ok)
+                except Exception:
+                    # If the batch check raises or returns the wrong shape,
+                    # treat every point as violated
+                    failed = np.arange(n_points)
+                inv.violations += len(failed)
+                violations.extend((int(i), inv.name) for i in failed)
+                continue
+            
+            for i in range(n_points):
+                kwargs: Dict[str, Any] = {}
+                if i > 0:
+                    kwargs['previous_state'] = y[:, i - 1]
+                    kwargs['previous_time'] = t[i - 1]
+                try:
+                    result = inv.func(t[i], y[:, i], params, **kwargs)
+                except Exception:
+                    # If invariant check raises exception, treat as violation
+                    result = False
+                if not result:
+                    inv.violations += 1
+                    violations.append((i, inv.name))
+        
+        violations.sort(key=lambda v: v[0])
+        return violations
+    
     def get_summary(self) -> Dict[str, Any]:
         """Get summary statistics for all invariants.
         
@@ -125,7 +247,8 @@ class InvariantChecker:
         self._previous_time = None
 
 
-def create_invariant(name: str, severity: str = 'warning'):
+def create_invariant(name: str, severity: str = 'warning',
+                     batch_func: Optional[BatchInvariantFunc] = None):
     """Decorator to create an InvariantCheck from a function.
     
     Args:
@@ -134,6 +257,16 @@ def create_invariant(name: str, severity: str = 'warning'):
             - 'warning': Logs violations but continues simulation
             - 'error': Logs violations, sets checks_passed=False, but continues
             - 'critical': Stops simulation immediately with RuntimeError
+        batch_func: Optional vectorized form of the check, f(t, Y, params)
+            returning one boolean per time point (shape (n_points,)), used
+            when checking a whole trajectory at once. Any other shape is
+            treated as a violation at every point
+    
+    Critical invariants are checked on every right-hand-side evaluation.
+    Warning and error invariants are checked by trace_run at each step of
+    the solved trajectory once integration finishes. When t_eval is passed,
+    the trajectory holds only the requested samples, so they are checked
+    on every right-hand-side evaluation instead.
     
     Returns:
         Decorator function that converts a function to an InvariantCheck
@@ -160,7 +293,8 @@ def create_invariant(name: str, severity: str = 'warning'):
         return InvariantCheck(
             name=name,
             func=wrapped_func,
-            severity=severity
+            severity=severity,
+            batch_func=batch_func
         )
     return decorator
 
@@ -174,7 +308,8 @@ def bounded(min_val: float, max_val: float,
     Args:
         min_val: Minimum allowed value
         max_val: Maximum allowed value
-        indices: Optional list of state indices to check. If None, checks all.
+        indices: Optional list of state indices (or a single index) to
+            check. If None, checks all.
     
     Returns:
         InvariantCheck object
@@ -186,18 +321,28 @@ def bounded(min_val: float, max_val: float,
         >>> # Check only first two states
         >>> bound_check = bounded(0.0, 1.0, indices=[0, 1])
     """
+    lower, upper = float(min_val), float(max_val)
+    if indices is not None:
+        # A single index still selects a (1, n_points) block in batch_func
+        indices = np.atleast_1d(indices)
+    
     def check_func(t: float, y: StateVector, params: ParamsDict, **kwargs) -> bool:
         y_array = np.asarray(y)
         if indices is not None:
             values = y_array[indices]
         else:
-            values = y_array.flatten()
-        return np.all((values >= min_val) & (values <= max_val))
+            values = y_array
+        return _all_within(values, lower, upper)
+    
+    def batch_func(t: np.ndarray, y: np.ndarray, params: ParamsDict) -> np.ndarray:
+        values = y[indices] if indices is not None else y
+        return np.all((values >= min_val) & (values <= max_val), axis=0)
     
     return InvariantCheck(
         name=f"bounded_{min_val}_{max_val}",
         func=check_func,
-        severity='error'
+        severity='error',
+        batch_func=batch_func
     )
 
 
@@ -230,11 +375,18 @@ def monotonic(increasing: bool = True, index: int = 0) -> InvariantCheck:
         else:
             return current_val <= previous_val
     
+    def batch_func(t: np.ndarray, y: np.ndarray, params: ParamsDict) -> np.ndarray:
+        steps = np.diff(y[index])
+        ok = np.ones(y.shape[1], dtype=bool)
+        ok[1:] = steps >= 0 if increasing else steps <= 0
+        return ok
+    
     direction = "increasing" if increasing else "decreasing"
     return InvariantCheck(
         name=f"monotonic_{direction}_index_{index}",
         func=check_func,
-        severity='warning'
+        severity='warning',
+        batch_func=batch_func
     )
 
 
@@ -249,12 +401,15 @@ def finite() -> InvariantCheck:
         >>> finite_check = finite()
     """
     def check_func(t: float, y: StateVector, params: ParamsDict, **kwargs) -> bool:
-        y_array = np.asarray(y)
-        return np.all(np.isfinite(y_array))
+        return _all_finite(np.asarray(y))
+    
+    def batch_func(t: np.ndarray, y: np.ndarray, params: ParamsDict) -> np.ndarray:
+        return np.all(np.isfinite(y), axis=0)
     
     return InvariantCheck(
         name="finite",
         func=check_func,
-        severity='critical'
+        severity='critical',
+        batch_func=batch_func
     )
 
@@ -5,7 +5,7 @@ This module defines explicit guarantees about what phytrace captures and
 what it can and cannot guarantee for reproducibility.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 
 
 class ReproducibilityContract:
@@ -69,6 +69,20 @@ class ReproducibilityContract:
             "Solver tolerances (rtol, atol) affect numerical precision and may vary",
             "Invariant violations indicate potential issues but do not prove correctness or incorrectness",
         ]
+        
+        # Display labels for the Markdown rendering, built once
+        self._captured_items = self._label_items(self.captured)
+        self._best_effort_items = self._label_items(self.best_effort)
+        self._not_guaranteed_items = self._label_items(self.not_guaranteed)
+        
+        # Rendered on first use by to_markdown()
+        self._markdown = None
+    
+    @staticmethod
+    def _label_items(entries: Dict[str, str]) -> List[Tuple[str, str]]:
+        """Pair each description with its title-cased display label."""
+        return [(key.replace('_', ' ').title(), description)
+                for key, description in entries.items()]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert contract to dictionary for serialization.
@@ -86,49 +100,44 @@ class ReproducibilityContract:
     def to_markdown(self) -> str:
         """Convert contract to Markdown format for documentation.
         
+        The contract is fixed after construction, so the text is rendered
+        once and reused on later calls.
+        
         Returns:
             Markdown-formatted contract
         """
-        lines = [
-            "# Reproducibility Contract",
-            "",
-            "This document explicitly defines what `phytrace` guarantees for reproducibility.",
-            "",
-            "## What is Captured",
-            "",
-        ]
-        
-        for key, description in self.captured.items():
-            lines.append(f"- **{key.replace('_', ' ').title()}**: {description}")
-        
-        lines.extend([
-            "",
-            "## Best-Effort (May Not Always Succeed)",
-            "",
-        ])
-        
-        for key, description in self.best_effort.items():
-            lines.append(f"- **{key.replace('_', ' ').title()}**: {description}")
-        
-        lines.extend([
-            "",
-            "## What is NOT Guaranteed",
-            "",
-        ])
+        if self._markdown is None:
+            self._markdown = "\n".join(self._iter_md())
+        return self._markdown
+    
+    def _iter_md(self) -> Iterator[str]:
+        """Yield the lines of the Markdown contract."""
+        yield "# Reproducibility Contract"
+        yield ""
+        yield "This document explicitly defines what `phytrace` guarantees for reproducibility."
+        yield ""
+        yield "## What is Captured"
+        yield ""
+        for label, description in self._captured_items:
+            yield f"- **{label}**: {description}"
         
-        for key, description in self.not_guaranteed.items():
-            lines.append(f"- **{key.replace('_', ' ').title()}**: {description}")
+        yield ""
+        yield "## Best-Effort (May Not Always Succeed)"
+        yield ""
+        for label, description in self._best_effort_items:
+            yield f"- **{label}**: {description}"
         
-        lines.extend([
-            "",
-            "## Known Limitations",
-            "",
-        ])
+        yield ""
+        yield "## What is NOT Guaranteed"
+        yield ""
+        for label, description in self._not_guaranteed_items:
+            yield f"- **{label}**: {description}"
         
+        yield ""
+        yield "## Known Limitations"
+        yield ""
         for limitation in self.limitations:
-            lines.append(f"- {limitation}")
-        
-        return "\n".join(lines)
+            yield f"- {limitation}"
     
     def get_summary(self) -> str:
         """Get a one-sentence summary of the contract.
@@ -144,8 +153,8 @@ class ReproducibilityContract:
         )
 
 
-# Global contract instance
-REPRODUCIBILITY_CONTRACT = ReproducibilityContract()
+# Global contract instance, built on first use
+_CONTRACT = None
 
 
 def get_reproducibility_contract() -> ReproducibilityContract:
@@ -154,5 +163,14 @@ def get_reproducibility_contract() -> ReproducibilityContract:
     Returns:
         ReproducibilityContract instance
     """
-    return REPRODUCIBILITY_CONTRACT
+    global _CONTRACT
+    if _CONTRACT is None:
+        _CONTRACT = ReproducibilityContract()
+    return _CONTRACT
+
 
+def __getattr__(name: str) -> Any:
+    """Resolve REPRODUCIBILITY_CONTRACT lazily (PEP 562)."""
+    if name == "REPRODUCIBILITY_CONTRACT":
+        return get_reproducibility_contract()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,7 +6,7 @@ for type checking and documentation purposes.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Literal, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Union
 from pathlib import Path
 
 import numpy as np
@@ -53,6 +53,19 @@ Returns:
     Derivative dy/dt
 """
 
+BatchInvariantFunc = Callable[[np.ndarray, np.ndarray, ParamsDict], np.ndarray]
+"""
+Function signature for vectorized invariant checks over a whole trajectory.
+
+Args:
+    t: Time points, shape (n_points,)
+    y: States, shape (n_states, n_points)
+    params: Simulation parameters
+
+Returns:
+    Boolean array of shape (n_points,), True where the invariant holds
+"""
+
 
 @dataclass
 class InvariantCheck:
@@ -64,12 +77,15 @@ class InvariantCheck:
         severity: How to handle violations ('warning', 'error', 'critical')
         total_checks: Number of times this invariant has been checked
         violations: Number of times this invariant has been violated
+        batch_func: Optional vectorized form of func used to check a whole
+            trajectory at once
     """
     name: str
     func: InvariantFunc
     severity: Literal['warning', 'error', 'critical'] = 'warning'
     total_checks: int = 0
     violations: int = 0
+    batch_func: Optional[BatchInvariantFunc] = None
 
 
 class TraceResult(OdeResult):
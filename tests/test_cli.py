@@ -0,0 +1,295 @@
+"""
+Tests for the command-line interface.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from phytrace._compare_impl import _compare_trajectories
+from phytrace import cli as cli_module
+from phytrace.cli import cli
+
+
+def write_csv(path, header, columns):
+    """Write columns of numbers as a CSV file with the given header."""
+    lines = [header]
+    lines.extend(",".join(repr(float(v)) for v in row) for row in np.column_stack(columns))
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def write_pack(path, manifest):
+    """Create a complete evidence pack around the given manifest."""
+    for name in ("data", "plots", "checks"):
+        (path / name).mkdir(parents=True)
+    (path / "manifest.json").write_text(json.dumps(manifest))
+    (path / "invariants.json").write_text('{"total_checks": 1}')
+    (path / "run_log.txt").write_text("log\n")
+    (path / "report.md").write_text("# Report\n")
+    write_csv(path / "data" / "trajectory.csv", "time,state_0", [[0.0, 1.0], [1.0, 0.5]])
+    return path
+
+
+def test_compare_parameters(tmp_path):
+    """Test the parameter diff of compare, in manifest order."""
+    pack1 = tmp_path / "one"
+    pack2 = tmp_path / "two"
+    pack1.mkdir()
+    pack2.mkdir()
+    (pack1 / "manifest.json").write_text(json.dumps(
+        {"simulation": {"params": {"k": 1.0, "same": 2, "gone": "N/A"}}}
+    ))
+    (pack2 / "manifest.json").write_text(json.dumps(
+        {"simulation": {"params": {"new": 3, "same": 2, "k": 1.5}}}
+    ))
+    
+    result = CliRunner().invoke(cli, ["compare", str(pack1), str(pack2)])
+    
+    assert result.exit_code == 0
+    # A literal 'N/A' value still differs from a missing parameter
+    assert result.output.splitlines() == [
+        "Parameter Comparison:",
+        "  k: 1.0 → 1.5",
+        "  gone: N/A → N/A",
+        "  new: N/A → 3",
+    ]
+
+
+def test_compare_no_parameter_differences(tmp_path):
+    """Test compare on identical packs, including the trajectory section."""
+    manifest = {"simulation": {"params": {"k": 1.0}}}
+    pack1 = write_pack(tmp_path / "one", manifest)
+    pack2 = write_pack(tmp_path / "two", manifest)
+    
+    result = CliRunner().invoke(cli, ["compare", str(pack1), str(pack2)])
+    
+    assert result.exit_code == 0
+    assert "  (No parameter differences)" in result.output
+    assert "✓ Trajectories match within tolerance" in result.output
+
+
+def test_compare_trajectories(tmp_path):
+    """Test max/RMS differences on the common time grid."""
+    t = np.linspace(0.0, 1.0, 11)
+    path1 = write_csv(tmp_path / "a.csv", "time,state_0,state_1", [t, t, -t])
+    path2 = write_csv(tmp_path / "b.csv", "time,state_0", [t, 2 * t])
+    
+    max_diff, rms_diff = _compare_trajectories(path1, path2)
+    
+    # Both trajectories are linear, so interpolation is exact: diff = -t
+    t_common = np.linspace(0.0, 1.0, 100)
+    assert max_diff == pytest.approx(1.0)
+    assert rms_diff == pytest.approx(np.sqrt(np.mean(t_common**2)))
+
+
+def test_compare_trajectories_backward_time(tmp_path):
+    """Test trajectories stored with decreasing time (backward integration)."""
+    t_backward = np.linspace(10.0, 0.0, 21)
+    t_forward = t_backward[::-1]
+    path1 = write_csv(tmp_path / "a.csv", "time,state_0", [t_backward, t_backward])
+    path2 = write_csv(tmp_path / "b.csv", "time,state_0", [t_forward, 10.0 - t_forward])
+    
+    max_diff, rms_diff = _compare_trajectories(path1, path2)
+    
+    # diff = 2t - 10 on the common grid over [0, 10]
+    t_common = np.linspace(0.0, 10.0, 100)
+    assert max_diff == pytest.approx(10.0)
+    assert rms_diff == pytest.approx(np.sqrt(np.mean((2 * t_common - 10.0)**2)))
+    assert rms_diff == pytest.approx(5.83, abs=0.01)
+
+
+def test_compare_trajectories_missing_columns(tmp_path):
+    """Test that files without time or state columns are not compared."""
+    t = np.linspace(0.0, 1.0, 5)
+    good = write_csv(tmp_path / "good.csv", "time,state_0", [t, t])
+    no_time = write_csv(tmp_path / "no_time.csv", "step,state_0", [t, t])
+    no_state = write_csv(tmp_path / "no_state.csv", "time,energy", [t, t])
+    
+    assert _compare_trajectories(good, no_time) is None
+    assert _compare_trajectories(no_state, good) is None
+
+
+def test_validate_json_invalid_manifest(tmp_path):
+    """Test validate --json on a pack whose manifest is not valid JSON."""
+    pack = tmp_path / "pack"
+    (pack / "data").mkdir(parents=True)
+    (pack / "manifest.json").write_text("{bad")
+    (pack / "invariants.json").write_text("{}")
+    
+    result = CliRunner().invoke(cli, ["validate", str(pack), "--json"])
+    
+    assert result.exit_code != 0
+    # The JSON report comes first; the failure message follows it
+    report, _ = json.JSONDecoder().raw_decode(result.output)
+    assert report["valid"] is False
+    assert report["checks"]["file_manifest.json"] is True
+    assert report["checks"]["json_valid_manifest.json"] is False
+    assert report["checks"]["manifest_readable"] is False
+    assert report["checks"]["invariants_json_valid"] is True
+    assert "Missing required file: run_log.txt" in report["issues"]
+    assert any(issue.startswith("Invalid JSON in manifest.json")
+               for issue in report["issues"])
+    assert report["warnings"] == ["invariants.json is empty"]
+    assert report["summary"]["total_issues"] == len(report["issues"])
+
+
+def test_import_without_click():
+    """Test that the CLI module imports without click and main() explains why."""
+    code = (
+        "import sys\n"
+        "sys.modules['click'] = None  # Make `import click` fail\n"
+        "import phytrace.cli as cli\n"
+        "assert not cli.CLICK_AVAILABLE\n"
+        "cli.main()\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    
+    assert result.returncode == 0, result.stderr
+    assert "click is required for CLI" in result.stdout
+
+
+def test_init_writes_templates(tmp_path):
+    """Test that init writes each template byte for byte."""
+    project = tmp_path / "project"
+    
+    result = CliRunner().invoke(cli, ["init", str(project)])
+    
+    assert result.exit_code == 0
+    assert (project / "simulation.py").read_bytes() == cli_module._SIM_TEMPLATE
+    assert (project / "phytrace.toml").read_bytes() == cli_module._CONFIG_TEMPLATE
+    assert (project / ".gitignore").read_bytes() == cli_module._GITIGNORE_TEMPLATE
+    assert b"from phytrace import trace_run" in cli_module._SIM_TEMPLATE
+    
+    # Files are created with mode 0o644, subject to the umask
+    umask = os.umask(0)
+    os.umask(umask)
+    mode = (project / "simulation.py").stat().st_mode & 0o777
+    assert mode == 0o644 & ~umask
+
+
+def test_init_keeps_existing_gitignore(tmp_path):
+    """Test that init overwrites its templates but not a user's .gitignore."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / ".gitignore").write_text("my_rules/\n")
+    (project / "simulation.py").write_text("x" * 5000)
+    
+    result = CliRunner().invoke(cli, ["init", str(project)])
+    
+    assert result.exit_code == 0
+    assert (project / ".gitignore").read_text() == "my_rules/\n"
+    # Existing template files are truncated, not partly overwritten
+    assert (project / "simulation.py").read_bytes() == cli_module._SIM_TEMPLATE
+
+
+
+FULL_MANIFEST = {
+    "environment": {"python": "3.11.0", "packages": {"numpy": "1.26.0"}},
+    "seeds": {"numpy": 42},
+    "reproducibility_contract": {},
+    "simulation": {"params": {"k": 1.0}, "solver": {"method": "RK45"}},
+    "invariants": [],
+}
+
+
+def validate_json(pack):
+    """Run validate --json on a pack and return the decoded report."""
+    result = CliRunner().invoke(cli, ["validate", str(pack), "--json"])
+    report, _ = json.JSONDecoder().raw_decode(result.output)
+    return report
+
+
+def test_validate_complete_pack(tmp_path):
+    """Test validate on a pack with every manifest section present."""
+    pack = write_pack(tmp_path / "pack", FULL_MANIFEST)
+    
+    result = CliRunner().invoke(cli, ["validate", str(pack)])
+    
+    assert result.exit_code == 0
+    assert result.output.splitlines()[0] == "✓ Evidence pack is valid and complete"
+    assert "Warnings:" not in result.output
+    
+    report = validate_json(pack)
+    assert report["valid"] is True
+    assert report["issues"] == [] and report["warnings"] == []
+    for key in ("environment", "seeds", "reproducibility_contract",
+                "simulation", "invariants"):
+        assert report["checks"][f"has_{key}"] is True
+
+
+@pytest.mark.parametrize("key, message, is_issue", [
+    ("environment", "Missing environment information in manifest", True),
+    ("seeds", "Missing seed information in manifest", True),
+    ("reproducibility_contract",
+     "Reproducibility contract not present in manifest (v0.1.2+)", False),
+    ("simulation", "Missing simulation information in manifest", True),
+    ("invariants", "No invariant definitions in manifest", False),
+])
+def test_validate_missing_manifest_section(tmp_path, key, message, is_issue):
+    """Test the issue or warning reported for each missing manifest section."""
+    manifest = {k: v for k, v in FULL_MANIFEST.items() if k != key}
+    pack = write_pack(tmp_path / "pack", manifest)
+    
+    report = validate_json(pack)
+    
+    assert f"has_{key}" not in report["checks"]
+    assert report["valid"] is not is_issue
+    if is_issue:
+        assert report["issues"] == [message]
+        assert report["warnings"] == []
+    else:
+        assert report["issues"] == []
+        assert report["warnings"] == [message]
+
+
+@pytest.mark.parametrize("section, subkey, message", [
+    ("environment", "python", "Python version not captured in environment"),
+    ("environment", "packages", "Package versions not captured in environment"),
+    ("simulation", "params", "No parameters recorded in simulation"),
+    ("simulation", "solver", "No solver configuration recorded"),
+])
+def test_validate_missing_manifest_subkey(tmp_path, section, subkey, message):
+    """Test the warning reported for each missing manifest sub-key."""
+    manifest = dict(FULL_MANIFEST)
+    manifest[section] = {k: v for k, v in FULL_MANIFEST[section].items() if k != subkey}
+    pack = write_pack(tmp_path / "pack", manifest)
+    
+    report = validate_json(pack)
+    
+    assert report["valid"] is True
+    assert report["checks"][f"has_{section}"] is True
+    assert report["warnings"] == [message]
+
+
+def test_validate_unset_seeds(tmp_path):
+    """Test that seeds which were all left unset produce a warning."""
+    manifest = dict(FULL_MANIFEST, seeds={"numpy": None, "python_random": None})
+    pack = write_pack(tmp_path / "pack", manifest)
+    
+    report = validate_json(pack)
+    
+    assert report["valid"] is True
+    assert report["checks"]["has_seeds"] is True
+    assert report["warnings"] == ["No seeds were successfully set"]
+
+
+def test_validate_manifest_not_an_object(tmp_path):
+    """Test validate on a manifest that is valid JSON but not an object."""
+    pack = write_pack(tmp_path / "pack", [FULL_MANIFEST])
+    
+    report = validate_json(pack)
+    
+    assert report["valid"] is False
+    assert report["checks"]["json_valid_manifest.json"] is True
+    assert report["checks"]["manifest_readable"] is False
+    assert report["issues"] == [
+        "Error reading manifest: 'list' object has no attribute 'get'"
+    ]
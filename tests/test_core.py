@@ -191,6 +191,31 @@ def test_custom_solver_kwargs(tmp_evidence_dir):
     # But the simulation should have used them
 
 
+def test_solver_args_passthrough():
+    """Test that solve_ivp's args are passed to simulate positionally."""
+    params = {'k': 1.0, 'c': 0.1, 'm': 1.0}
+    result_kwargs = trace_run(
+        simulate=damped_oscillator,
+        params=params,
+        t_span=(0, 5),
+        y0=[1.0, 0.0]
+    )
+    result_args = trace_run(
+        simulate=damped_oscillator,
+        params=params,
+        t_span=(0, 5),
+        y0=[1.0, 0.0],
+        args=(params['k'], params['c'], params['m'])
+    )
+
+    np.testing.assert_array_equal(result_kwargs.y, result_args.y)
+    assert result_args.manifest['simulation']['params'] == params
+    
+    # The values simulate actually ran on are recorded as well
+    assert result_args.manifest['simulation']['solver']['args'] == [1.0, 0.1, 1.0]
+    assert 'args' not in result_kwargs.manifest['simulation']['solver']
+
+
 def test_invariant_warning_severity(tmp_evidence_dir):
     """Test that warning severity doesn't stop simulation."""
     def sometimes_false(t, y, params, **kwargs):
@@ -245,3 +270,94 @@ def test_invariant_error_severity(tmp_evidence_dir):
     # checks_passed should be False
     assert result.checks_passed is False
 
+
+
+def test_shared_invariants_count_per_run():
+    """Test that invariant counters restart when reused in a new run."""
+    bound_check = bounded(-10.0, 10.0)
+    
+    result1 = trace_run(
+        simulate=exponential_decay,
+        params={'k': 0.5},
+        t_span=(0, 5),
+        y0=[1.0],
+        invariants=[bound_check]
+    )
+    result2 = trace_run(
+        simulate=exponential_decay,
+        params={'k': 0.5},
+        t_span=(0, 5),
+        y0=[1.0],
+        invariants=[bound_check]
+    )
+    
+    checks1 = result1.invariant_log['invariants'][0]['checks']
+    checks2 = result2.invariant_log['invariants'][0]['checks']
+    assert checks1 == checks2 == len(result2.t)
+
+
+def test_initial_state_normalized():
+    """Test that simulate and invariants receive contiguous float64 states."""
+    seen = []
+    
+    def record_state(t, y, params, **kwargs):
+        seen.append(y)
+        return True
+    
+    recorder = InvariantCheck(
+        name="record_state",
+        func=record_state,
+        severity='critical'
+    )
+    
+    result = trace_run(
+        simulate=exponential_decay,
+        params={'k': 0.5},
+        t_span=(0, 1),
+        y0=[1],
+        invariants=[recorder]
+    )
+    
+    assert result.manifest['simulation']['initial_state'] == [1.0]
+    assert all(y.dtype == np.float64 and y.flags.c_contiguous for y in seen)
+
+
+def test_empty_trajectory_returns_result():
+    """Test that a run whose solver stops before any t_eval point still returns."""
+    def blow_up(t, y):
+        return y**2
+    
+    # y = 1/(1 - t) diverges at t=1, before the first requested output time
+    result = trace_run(
+        simulate=blow_up,
+        params={},
+        t_span=(0, 2),
+        y0=[1.0],
+        invariants=[bounded(-1e3, 1e3)],
+        t_eval=[1.5, 2.0]
+    )
+    
+    assert not result.success
+    assert len(result.t) == 0
+    # With t_eval the bound is checked per step, so the blow-up is caught
+    assert result.checks_passed is False
+
+
+def test_sparse_t_eval_checks_every_step():
+    """Test that a breach between t_eval samples is still caught."""
+    def sine(t, y):
+        """x = sin(t), which exceeds 0.9 only between the samples below"""
+        return [np.cos(t)]
+    
+    result = trace_run(
+        simulate=sine,
+        params={},
+        t_span=(0, np.pi),
+        y0=[0.0],
+        invariants=[bounded(-0.9, 0.9, indices=[0])],
+        t_eval=[0, np.pi]
+    )
+    
+    assert result.invariant_log['invariants'][0]['violations'] > 0
+    assert result.checks_passed is False
+
@@ -0,0 +1,45 @@
+"""
+Tests for the lazily imported package namespace.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import phytrace
+
+
+def run_fresh(code):
+    """Run code in a fresh interpreter and return its stdout."""
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+
+def test_import_is_lazy():
+    """Test that importing phytrace does not load numpy or scipy."""
+    output = run_fresh(
+        "import sys, phytrace\n"
+        "print('numpy' in sys.modules, 'scipy' in sys.modules)"
+    )
+    assert output.split() == ["False", "False"]
+
+
+def test_submodule_attribute_access():
+    """Test that submodules are attributes after a bare `import phytrace`."""
+    output = run_fresh(
+        "import phytrace\n"
+        "print(phytrace.invariants.bounded(-1.0, 1.0).severity)\n"
+        "print(phytrace.core.trace_run is phytrace.trace_run)\n"
+        "print(phytrace.types.TraceResult is phytrace.TraceResult)\n"
+        "print(callable(phytrace.golden.store_golden))\n"
+        "print(callable(phytrace.reproducibility.get_reproducibility_contract))"
+    )
+    assert output.split() == ["error", "True", "True", "True", "True"]
+
+
+def test_unknown_attribute():
+    """Test that unknown names still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        phytrace.no_such_name
@@ -269,3 +269,77 @@ def test_invariant_checker_summary():
     if bound_stats['checks'] > 0:
         assert bound_stats['violation_rate'] == pytest.approx(bound_stats['violations'] / bound_stats['checks'])
 
+
+
+def test_check_trajectory():
+    """Test checking a whole trajectory with batch and per-point invariants."""
+    bound_check = bounded(-1.0, 1.0)
+    mono_check = monotonic(increasing=True, index=0)
+    
+    def below_one(t, y, params, **kwargs):
+        return y[0] < 1.0
+    
+    # No batch_func: called once per point
+    custom_inv = InvariantCheck(
+        name="below_one",
+        func=below_one,
+        severity='warning'
+    )
+    
+    checker = InvariantChecker([bound_check, mono_check, custom_inv])
+    t = np.array([0.0, 1.0, 2.0, 3.0])
+    y = np.array([
+        [0.0, 0.5, 1.5, 1.0],
+        [0.0, 0.0, 0.0, np.nan],
+    ])
+    
+    violations = checker.check_trajectory(t, y, {})
+    
+    assert violations == [
+        (2, bound_check.name),
+        (2, "below_one"),
+        (3, bound_check.name),
+        (3, mono_check.name),
+        (3, "below_one"),
+    ]
+    assert bound_check.total_checks == 4
+    assert bound_check.violations == 2
+    assert mono_check.violations == 1
+    assert custom_inv.total_checks == 4
+    assert custom_inv.violations == 2
+
+
+def test_check_trajectory_batch_shape():
+    """Test that batch results are checked per point, or rejected."""
+    t = np.array([0.0, 1.0, 2.0, 3.0])
+    y = np.array([
+        [2.0, 2.0, 2.0, 0.0],
+        [0.0, 0.0, 0.0, 0.0],
+    ])
+    
+    # A single index still yields one result per point
+    bound_check = bounded(-1.0, 1.0, indices=0)
+    violations = InvariantChecker([bound_check]).check_trajectory(t, y, {})
+    assert [i for i, _ in violations] == [0, 1, 2]
+    
+    # A batch_func returning the wrong shape fails every point
+    scalar_inv = InvariantCheck(
+        name="scalar_batch",
+        func=lambda t, y, params, **kwargs: True,
+        severity='warning',
+        batch_func=lambda t, y, params: True
+    )
+    InvariantChecker([scalar_inv]).check_trajectory(t, y, {})
+    assert scalar_inv.violations == 4
+
+
+def test_check_trajectory_empty():
+    """Test that an empty trajectory is checked without error."""
+    bound_check = bounded(-1.0, 1.0)
+    checker = InvariantChecker([bound_check])
+    
+    violations = checker.check_trajectory(np.array([]), np.empty((2, 0)), {})
+    
+    assert violations == []
+    assert bound_check.total_checks == 0
+